@@ -1,87 +1,65 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-from .assertion import MockoonTransactionAssertion
-from .controllers import (MockoonHttpTransactionController,
-                          MockoonLoggingController, MockoonServerController,
-                          MockoonStateController, MockoonTransactionController)
+from .assertion import MockoonTransactionAssertion, TransactionAssertion
 from .models import Request, Transaction
 from .server import MockoonServer
 
 
-class API(ABC):
-    @abstractmethod
+class API(Protocol):
     def start_logging(self):
         ...
 
-    @abstractmethod
     def stop_logging(self):
         ...
 
-    @abstractmethod
-    def wait_for_route_hit(self, route: str):
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
         ...
 
-    @abstractmethod
-    def wait_for_active(self):
+    def wait_for_active(self, timeout: float | None = None):
         ...
 
-    @abstractmethod
     def __enter__(self):
         ...
 
-    @abstractmethod
     def __exit__(self, exc_type, exc_value, traceback):
         ...
 
-    @abstractmethod
     def start(self):
         ...
 
-    @abstractmethod
     def stop(self):
         ...
 
-    @abstractmethod
     def transactions(self) -> list[Transaction]:
         ...
 
-    @abstractmethod
     def reset_transactions(self):
         ...
 
-    @abstractmethod
     def assert_not_called(self):
         ...
 
-    @abstractmethod
     def assert_called(self):
         ...
 
-    @abstractmethod
     def assert_called_once(self):
         ...
 
-    @abstractmethod
     def assert_called_once_with(self, request: Request):
         ...
 
-    @abstractmethod
     def assert_called_with(self, request: Request):
         ...
 
-    @abstractmethod
     def assert_has_calls(self, requests: list[Request], *, any_order=False):
         ...
 
-    @abstractmethod
     def assert_called_once_with_properties(self, **kwargs):
         ...
 
-    @abstractmethod
     def assert_called_with_properties(self, **kwargs):
         ...
 
-    @abstractmethod
     def assert_has_calls_with_properties(self, calls, *, any_order=False):
         ...
 
@@ -96,6 +74,8 @@ class MockoonAPI:
         *,
         use_docker: bool = False,
         repair: bool | None = False,
+        poll_interval: float | None = None,
+        keep_all_messages: bool = False,
     ):
         self.server = MockoonServer(
             data_file,
@@ -104,25 +84,22 @@ class MockoonAPI:
             pname,
             use_docker=use_docker,
             repair=repair,
+            poll_interval=poll_interval,
+            keep_all_messages=keep_all_messages,
         )
-        self.server_controller = MockoonServerController(self.server)
-        self.transaction_controller = MockoonTransactionController(self.server)
-        self.logging_controller = MockoonLoggingController(self.server)
-        self.http_transaction_controller = MockoonHttpTransactionController(self.server)
-        self.state_controller = MockoonStateController(self.server)
-        self.assertions = MockoonTransactionAssertion(self.server)
+        self.assertions: TransactionAssertion = MockoonTransactionAssertion(self.server)
 
     def start_logging(self):
-        self.logging_controller.start_logging()
+        self.server.start_log_stream()
 
     def stop_logging(self):
-        self.logging_controller.stop_logging()
+        self.server.stop_log_stream()
 
-    def wait_for_route_hit(self, route: str):
-        self.http_transaction_controller.wait_for_route_hit(route)
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
+        self.server.wait_for_route_hit(route, timeout)
 
-    def wait_for_active(self):
-        self.state_controller.wait_for_active()
+    def wait_for_active(self, timeout: float | None = None):
+        self.server.wait_for_active(timeout)
 
     def __enter__(self):
         """Start the MockoonServer and return the instance when used in a 'with' statement."""
@@ -134,10 +111,10 @@ class MockoonAPI:
         self.stop()
 
     def start(self):
-        self.server_controller.start()
+        self.server.start()
 
     def stop(self):
-        self.server_controller.stop()
+        self.server.stop()
 
     @property
     def root_uri(self):
@@ -145,34 +122,19 @@ class MockoonAPI:
 
     @property
     def transactions(self) -> list[Transaction]:
-        return self.transaction_controller.transactions
+        return self.server.transactions
 
     def reset_transactions(self):
-        self.transaction_controller.reset_transactions()
-
-    def assert_not_called(self):
-        self.assertions.assert_not_called()
-
-    def assert_called(self):
-        self.assertions.assert_called()
-
-    def assert_called_once(self):
-        self.assertions.assert_called_once()
-
-    def assert_called_once_with(self, request: Request):
-        self.assertions.assert_called_once_with(request)
-
-    def assert_called_with(self, request: Request):
-        self.assertions.assert_called_with(request)
-
-    def assert_has_calls(self, requests: list[Request], *, any_order=False):
-        self.assertions.assert_has_calls(requests, any_order=any_order)
-
-    def assert_called_once_with_properties(self, **kwargs):
-        self.assertions.assert_called_once_with_properties(**kwargs)
-
-    def assert_called_with_properties(self, **kwargs):
-        self.assertions.assert_called_with_properties(**kwargs)
-
-    def assert_has_calls_with_properties(self, calls, *, any_order=False):
-        self.assertions.assert_has_calls_with_properties(calls, any_order=any_order)
+        self.server.reset_transactions()
+
+    def __getattr__(self, name):
+        """Forward assertion methods, such as `assert_called_once`, to the transaction assertions.
+
+        The bound method is cached on the instance, so later lookups do not reach `__getattr__`.
+        """
+        if name.startswith("assert_"):
+            attr = getattr(self.assertions, name)
+            self.__dict__[name] = attr
+            return attr
+        msg = f"'{type(self).__name__}' object has no attribute '{name}'"
+        raise AttributeError(msg)
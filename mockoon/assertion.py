@@ -1,92 +1,116 @@
-from abc import ABC, abstractmethod
+from collections import Counter, deque
+from operator import attrgetter, itemgetter
+from typing import Protocol
 
 from .models import Request
 from .server import MockoonServer
 
+_REQUEST_FIELDS = frozenset(Request.model_fields)
+_METHOD_AND_ROUTE_FIELDS = frozenset({"method", "route"})
 
-class TransactionAssertion(ABC):
+
+class TransactionAssertion(Protocol):
     @property
-    @abstractmethod
     def call_count(self):
         ...
 
     @property
-    @abstractmethod
     def called(self):
         ...
 
     @property
-    @abstractmethod
     def call_request(self):
         ...
 
     @property
-    @abstractmethod
     def call_requests_list(self):
         ...
 
-    @abstractmethod
     def assert_not_called(self):
         ...
 
-    @abstractmethod
     def assert_called(self):
         ...
 
-    @abstractmethod
     def assert_called_once(self):
         ...
 
-    @abstractmethod
     def assert_called_once_with(self, request):
         ...
 
-    @abstractmethod
     def assert_called_with(self, request):
         ...
 
-    @abstractmethod
     def assert_has_calls(self, requests: list[Request], *, any_order=False):
         ...
 
-    @abstractmethod
     def assert_called_once_with_properties(self, **kwargs):
         ...
 
-    @abstractmethod
     def assert_called_with_properties(self, **kwargs):
         ...
 
-    @abstractmethod
     def assert_has_calls_with_properties(self, calls, *, any_order=False):
         ...
 
 
-class MockoonTransactionAssertion(TransactionAssertion):
+class MockoonTransactionAssertion:
     def __init__(self, server: MockoonServer):
         self.server = server
 
+        self._cached_requests: list[Request] = []
+        self._cached_counter: Counter | None = None
+        self._cached_positions: dict | None = None
+        self._cached_version: int = -1
+
     @property
     def call_count(self):
         """Return the number of calls to the mock server."""
-        return len(self.server.transactions)
+        return len(self.call_requests_list)
 
     @property
     def called(self):
         """Return True if the mock server was called at least once, False otherwise."""
-        return bool(self.server.transactions)
+        return bool(self.call_requests_list)
 
     @property
     def call_request(self):
         """Return the last request to the mock server."""
-        return (
-            self.server.transactions[-1].request if self.server.transactions else None
-        )
+        requests = self.call_requests_list
+        return requests[-1] if requests else None
 
     @property
     def call_requests_list(self):
-        """Return the list of requests to the mock server."""
-        return [t.request for t in self.server.transactions]
+        """Return the list of requests to the mock server.
+
+        Views derived from the list are rebuilt only when the server's transactions have changed since the last access.
+        """
+        version = self.server.transactions_version
+        if version != self._cached_version:
+            self._cached_requests = self.server.request_list
+            self._cached_counter = None
+            self._cached_positions = None
+            self._cached_version = version
+        return self._cached_requests
+
+    @property
+    def _call_requests_counter(self):
+        """Return the number of calls to the mock server for each distinct request."""
+        requests = self.call_requests_list
+        if self._cached_counter is None:
+            self._cached_counter = Counter(requests)
+        return self._cached_counter
+
+    @property
+    def _call_request_positions(self):
+        """Return the positions in the list of requests to the mock server of each distinct request."""
+        requests = self.call_requests_list
+        if self._cached_positions is None:
+            positions = {}
+            for position, request in enumerate(requests):
+                positions.setdefault(request, []).append(position)
+            self._cached_positions = positions
+        return self._cached_positions
 
     def assert_not_called(self):
         """Assert the mock server was never called."""
@@ -102,7 +126,7 @@ class MockoonTransactionAssertion(TransactionAssertion):
 
     def _get_no_of_calls_with_request(self, request):
         """Return the number of calls that the server has that matches a request."""
-        return self.call_requests_list.count(request)
+        return self._call_requests_counter[request]
 
     def assert_called_once_with(self, request):
         """Assert the mock server was called exactly once with the specified arguments."""
@@ -115,80 +139,123 @@ class MockoonTransactionAssertion(TransactionAssertion):
     def assert_has_calls(self, requests: list[Request], *, any_order=False):
         """Assert the mock server has been called with the specified calls."""
         if any_order:
-            remaining_requests = self.call_requests_list.copy()
-            for request in requests:
-                if request in remaining_requests:
-                    remaining_requests.remove(request)
-                else:
-                    msg = f"Expected call not found: {request}"
-                    raise AssertionError(msg)
+            missing_requests = Counter(requests) - self._call_requests_counter
+            if missing_requests:
+                msg = f"Expected call not found: {next(iter(missing_requests))}"
+                raise AssertionError(msg)
         else:
-            matched_request_count = 0
+            expected_requests = iter(requests)
+            expected_request = next(expected_requests, None)
             for actual_request in self.call_requests_list:
-                if requests[matched_request_count] == actual_request:
-                    matched_request_count += 1
-                    if matched_request_count == len(requests):
-                        break
+                if expected_request is None:
+                    break
+                if actual_request == expected_request:
+                    expected_request = next(expected_requests, None)
 
-            if matched_request_count != len(requests):
+            if expected_request is not None:
                 msg = f"Expected calls {requests} not found in the same order in {self.call_requests_list}"
                 raise AssertionError(
                     msg,
                 )
 
-    def _request_matches(self, actual_request, **kwargs):
-        """Check if the actual request matches the specified properties."""
-        for key, value in kwargs.items():
-            if (
-                not hasattr(actual_request, key)
-                or getattr(actual_request, key) != value
-            ):
-                return False
-        return True
-
-    def _get_no_of_calls_with_properties(self, **kwargs):
-        """Return the number of calls that the server has that matches the specified properties."""
-        return sum(
-            1
+    @staticmethod
+    def _compile_matcher(properties):
+        """Resolve the specified properties into a list of (getter, value) pairs."""
+        unknown_fields = properties.keys() - _REQUEST_FIELDS
+        if unknown_fields:
+            msg = f"Unknown request fields: {sorted(unknown_fields)}"
+            raise TypeError(msg)
+        return [(attrgetter(key), value) for key, value in properties.items()]
+
+    @staticmethod
+    def _request_matches(actual_request, matcher):
+        """Check if the actual request matches the compiled properties."""
+        return all(getter(actual_request) == value for getter, value in matcher)
+
+    def _has_call_with_properties(self, matcher):
+        """Return True as soon as a call that matches the compiled properties is found."""
+        return any(
+            self._request_matches(request, matcher)
             for request in self.call_requests_list
-            if self._request_matches(request, **kwargs)
         )
 
+    def _count_calls_with_properties_up_to(self, matcher, limit):
+        """Return the number of calls that match the compiled properties, stopping once it exceeds the limit."""
+        count = 0
+        for request in self.call_requests_list:
+            if self._request_matches(request, matcher):
+                count += 1
+                if count > limit:
+                    break
+        return count
+
+    def _count_calls_with_method_and_route(self, properties):
+        """Return the number of calls with the specified method and route, or None if other properties are specified."""
+        if properties.keys() != _METHOD_AND_ROUTE_FIELDS:
+            return None
+        try:
+            return self.server.method_and_route_counts[
+                properties["method"],
+                properties["route"],
+            ]
+        except TypeError:
+            # Unhashable values cannot be looked up, so leave them to the full scan
+            return None
+
     def assert_called_once_with_properties(self, **kwargs):
         """Assert the mock server was called exactly once with the specified properties."""
-        assert self._get_no_of_calls_with_properties(**kwargs) == 1
+        count = self._count_calls_with_method_and_route(kwargs)
+        if count is None:
+            matcher = self._compile_matcher(kwargs)
+            count = self._count_calls_with_properties_up_to(matcher, 1)
+        assert count == 1
 
     def assert_called_with_properties(self, **kwargs):
         """Assert the mock server was last called with the specified properties."""
-        assert self._get_no_of_calls_with_properties(**kwargs) > 0
+        count = self._count_calls_with_method_and_route(kwargs)
+        if count is None:
+            assert self._has_call_with_properties(self._compile_matcher(kwargs))
+        else:
+            assert count > 0
 
     def assert_has_calls_with_properties(self, calls, *, any_order=False):
         """Assert the mock server has been called with the specified calls, each containing the specified properties."""
+        matchers = [self._compile_matcher(call) for call in calls]
+
         if any_order:
-            remaining_requests = self.call_requests_list.copy()
-            for call in calls:
-                matching_request = next(
+            # Match against each distinct request rather than every call, and consume
+            #   the earliest remaining call of the matching requests each time
+            requests = self.call_requests_list
+            remaining_positions = {
+                key: deque(positions)
+                for key, positions in self._call_request_positions.items()
+            }
+            for call, matcher in zip(calls, matchers, strict=True):
+                matching_positions = min(
                     (
-                        request
-                        for request in remaining_requests
-                        if self._request_matches(request, **call)
+                        positions
+                        for positions in remaining_positions.values()
+                        if positions
+                        and self._request_matches(requests[positions[0]], matcher)
                     ),
-                    None,
+                    key=itemgetter(0),
+                    default=None,
                 )
-                if matching_request:
-                    remaining_requests.remove(matching_request)
+                if matching_positions is not None:
+                    matching_positions.popleft()
                 else:
                     msg = f"Expected call not found: {call}"
                     raise AssertionError(msg)
         else:
-            matched_call_count = 0
+            remaining_matchers = iter(matchers)
+            matcher = next(remaining_matchers, None)
             for actual_request in self.call_requests_list:
-                if self._request_matches(actual_request, **calls[matched_call_count]):
-                    matched_call_count += 1
-                    if matched_call_count == len(calls):
-                        break
+                if matcher is None:
+                    break
+                if self._request_matches(actual_request, matcher):
+                    matcher = next(remaining_matchers, None)
 
-            if matched_call_count != len(calls):
+            if matcher is not None:
                 msg = f"Expected calls {calls} not found in the same order in {self.call_requests_list}"
                 raise AssertionError(
                     msg,
@@ -1,18 +1,17 @@
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from ..server import MockoonServer as Server
 
 
-class HttpTransactionController(ABC):
-    @abstractmethod
-    def wait_for_route_hit(self, route: str):
+class HttpTransactionController(Protocol):
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
         ...
 
 
-class MockoonHttpTransactionController(HttpTransactionController):
+class MockoonHttpTransactionController:
     def __init__(self, server: Server):
         self.server = server
 
-    def wait_for_route_hit(self, route: str):
-        self.server.wait_for_route_hit(route)
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
+        self.server.wait_for_route_hit(route, timeout)
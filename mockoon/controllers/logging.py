@@ -1,19 +1,17 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from ..server import MockoonServer as Server
 
 
-class LoggingController(ABC):
-    @abstractmethod
+class LoggingController(Protocol):
     def start_logging(self):
         ...
 
-    @abstractmethod
     def stop_logging(self):
         ...
 
 
-class MockoonLoggingController(LoggingController):
+class MockoonLoggingController:
     def __init__(self, server: Server):
         self.server = server
 
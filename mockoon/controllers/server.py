@@ -1,19 +1,17 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from ..server import MockoonServer as Server
 
 
-class ServerController(ABC):
-    @abstractmethod
+class ServerController(Protocol):
     def start(self):
         ...
 
-    @abstractmethod
     def stop(self):
         ...
 
 
-class MockoonServerController(ServerController):
+class MockoonServerController:
     def __init__(self, server: Server):
         self.server = server
 
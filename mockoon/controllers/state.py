@@ -1,16 +1,15 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from ..server import MockoonServer
 
 
-class StateController(ABC):
-    @abstractmethod
-    def wait_for_active(self):
+class StateController(Protocol):
+    def wait_for_active(self, timeout: float | None = None):
         ...
 
-class MockoonStateController(StateController):
+class MockoonStateController:
     def __init__(self, server: MockoonServer):
         self.server = server
 
-    def wait_for_active(self):
-        self.server.wait_for_active()
+    def wait_for_active(self, timeout: float | None = None):
+        self.server.wait_for_active(timeout)
@@ -1,21 +1,19 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from ..models.transaction import Transaction
 from ..server import MockoonServer as Server
 
 
-class TransactionController(ABC):
+class TransactionController(Protocol):
     @property
-    @abstractmethod
     def transactions(self) -> list[Transaction]:
         ...
 
-    @abstractmethod
     def reset_transactions(self):
         ...
 
 
-class MockoonTransactionController(TransactionController):
+class MockoonTransactionController:
     def __init__(self, server: Server):
         self.server = server
 
@@ -1,2 +1 @@
 from .log_file import LogFileEventHandler
-from .wait_for_file_create import WaitForFileCreationHandler
@@ -1,3 +1,4 @@
+import os
 from logging import getLogger
 from pathlib import Path
 
@@ -14,23 +15,50 @@ class LogFileEventHandler(FileSystemEventHandler):
 
         Parameters
         ----------
-        callback (callable): The function to call when processing a log line.
+        callback (callable): The function to call with each batch of new log lines, as bytes.
         target_file (Path): The log file to watch for changes.
         """
         self.callback = callback
         self.target_file = target_file
+        # Watchdog may report event paths as str or bytes
+        self._target_paths = (str(target_file), os.fsencode(target_file))
+        self._offset = 0
+        # Kept open between events so that each event only reads the newly appended data
+        self._file = None
+
+    def _read_new_lines(self):
+        """Process the complete lines appended to the log file since the last read as one batch."""
+        if self._file is None:
+            self._file = self.target_file.open("rb")
+
+        if os.fstat(self._file.fileno()).st_size < self._offset:
+            # The log file has been truncated, so start again from the beginning
+            self._offset = 0
+
+        lines = []
+        self._file.seek(self._offset)
+        while line := self._file.readline():
+            if not line.endswith(b"\n"):
+                # Line is still being written - pick it up on the next event
+                break
+            lines.append(line)
+            self._offset = self._file.tell()
+
+        if lines:
+            self.callback(lines)
+
+    def close(self):
+        """Close the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
     def initial_read(self):
         """Read and process the initial content of the log file."""
-        with self.target_file.open() as file:
-            content = file.readlines()
-            for line in content:
-                self.callback(line)
+        self._read_new_lines()
 
     def on_modified(self, event):
         """Handle the file modification event."""
-        if str(event.src_path) == str(self.target_file):
-            with Path(event.src_path).open() as file:
-                content = file.readlines()
-                for line in content[-1:]:
-                    self.callback(line)
+        if event.is_directory or event.src_path not in self._target_paths:
+            return
+        self._read_new_lines()
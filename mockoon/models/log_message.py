@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .transaction import Transaction
 
 
 class LogMessage(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     level: str
     message: str
     timestamp: str
@@ -12,14 +14,15 @@ class LogMessage(BaseModel):
 
     @classmethod
     def from_log_entry(cls, log_entry):
-        _transaction = None
-
-        if "transaction" in log_entry:
-            _transaction = Transaction.from_log_entry(log_entry["transaction"])
-            del log_entry["transaction"]
-
-        # Not all messages relate to a mock - e.g. proxy creation
-        if "mockName" not in log_entry:
-            log_entry["mockName"] = None
+        transaction = log_entry.get("transaction")
 
-        return cls(transaction=_transaction, **log_entry)
+        return cls(
+            level=log_entry["level"],
+            message=log_entry["message"],
+            timestamp=log_entry["timestamp"],
+            # Not all messages relate to a mock - e.g. proxy creation
+            mockName=log_entry.get("mockName"),
+            transaction=(
+                Transaction.from_log_entry(transaction) if transaction else None
+            ),
+        )
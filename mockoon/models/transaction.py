@@ -1,15 +1,17 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
 def list_of_dicts_to_dict(input_list: list[dict[str, str]]) -> dict[str, str]:
-    output_dict = {}
-    for item in input_list:
-        if "key" in item and "value" in item:
-            output_dict[item["key"]] = item["value"]
-    return output_dict
+    return {
+        item["key"]: item["value"]
+        for item in input_list
+        if "key" in item and "value" in item
+    }
 
 
 class Request(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     body: str
     headers: dict[str, str]
     method: str
@@ -19,32 +21,53 @@ class Request(BaseModel):
     route: str
     urlPath: str  # noqa: N815
 
-    @classmethod
-    def from_log_entry(cls, log_entry):
-        _headers_list = log_entry["headers"]
-        del log_entry["headers"]
-
-        headers = list_of_dicts_to_dict(_headers_list)
-
-        _params_list = log_entry["params"]
-        del log_entry["params"]
+    _key: tuple = PrivateAttr()
+
+    def model_post_init(self, _context, /):
+        # Precompute the hashable identity of the request once,
+        #   so that it can be compared and used as a dict key cheaply
+        self._key = (
+            self.method,
+            self.route,
+            self.urlPath,
+            self.body,
+            self.query,
+            frozenset(self.headers.items()),
+            frozenset(self.params.items()),
+            frozenset(self.queryParams.items()),
+        )
 
-        params = list_of_dicts_to_dict(_params_list)
+    def model_copy(self, *, update=None, deep=False):
+        copy = super().model_copy(update=update, deep=deep)
+        # Updated fields bypass validation, so the key has to be rebuilt
+        copy.model_post_init(None)
+        return copy
 
-        _query_params_list = log_entry["queryParams"]
-        del log_entry["queryParams"]
+    def __hash__(self):
+        return hash(self._key)
 
-        query_params = list_of_dicts_to_dict(_query_params_list)
+    def __eq__(self, other):
+        if not isinstance(other, Request):
+            return NotImplemented
+        return self._key == other._key
 
+    @classmethod
+    def from_log_entry(cls, log_entry):
         return cls(
-            headers=headers,
-            params=params,
-            queryParams=query_params,
-            **log_entry,
+            body=log_entry["body"],
+            headers=list_of_dicts_to_dict(log_entry["headers"]),
+            method=log_entry["method"],
+            params=list_of_dicts_to_dict(log_entry["params"]),
+            query=log_entry["query"],
+            queryParams=list_of_dicts_to_dict(log_entry["queryParams"]),
+            route=log_entry["route"],
+            urlPath=log_entry["urlPath"],
         )
 
 
 class Response(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     body: str
     headers: dict[str, str]
     statusCode: int  # noqa: N815
@@ -52,15 +75,17 @@ class Response(BaseModel):
 
     @classmethod
     def from_log_entry(cls, log_entry):
-        _headers_list = log_entry["headers"]
-        del log_entry["headers"]
-
-        headers = list_of_dicts_to_dict(_headers_list)
-
-        return cls(headers=headers, **log_entry)
+        return cls(
+            body=log_entry["body"],
+            headers=list_of_dicts_to_dict(log_entry["headers"]),
+            statusCode=log_entry["statusCode"],
+            statusMessage=log_entry.get("statusMessage"),
+        )
 
 
 class Transaction(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     proxied: bool
     request: Request
     response: Response
@@ -69,20 +94,11 @@ class Transaction(BaseModel):
 
     @classmethod
     def from_log_entry(cls, log_entry):
-        _request_dict = log_entry["request"]
-        del log_entry["request"]
-
-        request = Request.from_log_entry(_request_dict)
-
-        _response_dict = log_entry["response"]
-        del log_entry["response"]
-        response = Response.from_log_entry(_response_dict)
-
-        # If route is proxied, UUIDs are not created
-        if "routeResponseUUID" not in log_entry:
-            log_entry["routeResponseUUID"] = None
-
-        if "routeUUID" not in log_entry:
-            log_entry["routeUUID"] = None
-
-        return cls(request=request, response=response, **log_entry)
+        return cls(
+            proxied=log_entry["proxied"],
+            request=Request.from_log_entry(log_entry["request"]),
+            response=Response.from_log_entry(log_entry["response"]),
+            # If route is proxied, UUIDs are not created
+            routeResponseUUID=log_entry.get("routeResponseUUID"),
+            routeUUID=log_entry.get("routeUUID"),
+        )
@@ -1,64 +1,106 @@
-import json
-from abc import ABC, abstractmethod
+import os
+import sys
+from collections import Counter, deque
+from functools import cache, cached_property
 from logging import getLogger
 from pathlib import Path
-from queue import Empty, Queue
+from selectors import EVENT_READ, DefaultSelector
 from shutil import which
-from subprocess import DEVNULL, PIPE, Popen, run
-from threading import Event, Thread
-from time import sleep, time
+from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired, run
+from threading import Condition, Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Protocol
 
 from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
-from .file_handlers import LogFileEventHandler, WaitForFileCreationHandler
-from .models import LogMessage
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .file_handlers import LogFileEventHandler
+from .models import LogMessage, Request, Transaction
 
 logger = getLogger(__name__)
 
 
-class Server(ABC):
-    @abstractmethod
+# Events are interned so that looking up pending events can match on identity
+_READY_EVENT = sys.intern("ready")
+_TRANSACTION_KEY = b'"transaction"'
+_SERVER_STARTED_PREFIX = "Server started on port "
+_SERVER_STARTED_PREFIX_BYTES = _SERVER_STARTED_PREFIX.encode()
+
+
+@cache
+def _has_command(command):
+    """Return True if the command is available on the PATH, which is only searched once per command."""
+    return which(command) is not None
+
+
+def _stop_process(process, timeout):
+    """Terminate a process, killing it if it has not exited within the timeout."""
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _parse_log_line(line):
+    """Parse a JSON-formatted log line into a LogMessage."""
+    return LogMessage.from_log_entry(json_loads(line))
+
+
+class Server(Protocol):
     def __enter__(self):
         ...
 
-    @abstractmethod
     def __exit__(self, exc_type, exc_value, traceback):
         ...
 
-    @abstractmethod
     def start(self):
         ...
 
-    @abstractmethod
-    def wait_for_active(self):
+    def wait_for_active(self, timeout: float | None = None):
         ...
 
-    @abstractmethod
-    def wait_for_route_hit(self, route: str):
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
         ...
 
-    @abstractmethod
     def stop(self):
         ...
 
     @property
-    @abstractmethod
     def root_uri(self):
         ...
 
     @property
-    @abstractmethod
     def transactions(self):
         ...
 
-    @abstractmethod
+    @property
+    def request_list(self):
+        ...
+
+    @property
+    def method_and_route_counts(self):
+        ...
+
     def reset_transactions(self):
         ...
 
 
 class MockoonServer:
+    DOCKER_IMAGE = "mockoon/cli:latest"
     WAIT_TIMEOUT = 30
+    PROCESS_STOP_TIMEOUT = 5
+    LOG_FILE_TIMEOUT = 60
+    LOG_FILE_POLL_INTERVAL = 0.02
+    MAX_LOG_MESSAGES = 100_000
+    POLL_INTERVAL = 1
+    READ_CHUNK_SIZE = 65536
 
     def __init__(
         self,
@@ -69,6 +111,8 @@ class MockoonServer:
         *,
         use_docker: bool = False,
         repair: bool | None = False,
+        poll_interval: float | None = None,
+        keep_all_messages: bool = False,
     ) -> None:
         """Initialize a new MockoonServer instance.
 
@@ -80,6 +124,10 @@ class MockoonServer:
         pname (str, optional): The process name for the server. Defaults to None.
         use_docker (bool, optional): Whether to use Docker to run the server. Defaults to False.
         repair (bool, optional): Whether to repair the data file before starting the server. Defaults to False.
+        poll_interval (float, optional): Seconds between checks of the log file when polling for changes.
+            Defaults to POLL_INTERVAL.
+        keep_all_messages (bool, optional): Whether to keep log messages without a transaction in `log_messages`.
+            Defaults to False.
         """
         if not Path(data_file).exists():
             msg = f"Mockoon server environment data file not found: {data_file}"
@@ -89,13 +137,17 @@ class MockoonServer:
 
         self.data_file = Path(data_file)
 
-        data = json.load(self.data_file.open())
+        # The data file is only needed for the settings that were not given
+        if hostname and port and pname:
+            data = {}
+        else:
+            data = json_loads(self.data_file.read_bytes())
 
-        if use_docker and not which("docker"):
+        if use_docker and not _has_command("docker"):
             msg = "mockoon-cli is not available locally"
             raise Exception(msg)
 
-        if not use_docker and not which("mockoon-cli"):
+        if not use_docker and not _has_command("mockoon-cli"):
             msg = "mockoon-cli is not available locally"
             raise Exception(msg)
 
@@ -105,13 +157,40 @@ class MockoonServer:
         self.port = port if port else data["port"]
         self.pname = pname if pname else data["name"].replace(" ", "-").lower()
         self.repair = repair
-
-        self.log_messages: list[LogMessage] = []
+        self.poll_interval = (
+            self.POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self.keep_all_messages = keep_all_messages
+        self._log_path = Path(
+            f"~/.mockoon-cli/logs/mockoon-{self.pname}-out.log",
+        ).expanduser()
+
+        # Only the most recent log messages are kept, as every transaction is also kept below
+        self.log_messages: deque[LogMessage] = deque(maxlen=self.MAX_LOG_MESSAGES)
+        self._transactions: list[Transaction] = []
+        self._requests: list[Request] = []
+        self._method_and_route_counts: Counter[tuple[str, str]] = Counter()
+        self.transactions_version = 0
 
         self.log_streaming_thread = None
-
-        self.event_queue: Queue[str] = Queue()
+        # Docker logs process or log file path, created once per start
+        self._log_source_handle: Popen | Path | None = None
+        # Partial line read from the Docker logs process, completed by the next read
+        self._pipe_buffer = b""
+        # Reader of the mockoon-cli log file, which tracks how far the file has been read
+        self._log_file_handler: LogFileEventHandler | None = None
+        # Native 'mockoon-cli start' process, reaped when the server is stopped
+        self._cli_process: Popen | None = None
+
+        # Events received from the log stream that have not been waited for yet
+        self._pending_events: Counter[str] = Counter()
+        self._ready_seen = False
+        self._log_stream_ended = False
+        self._events_condition = Condition()
         self.stop_event = Event()
+        # Write end of a pipe used to wake the Docker log stream when stopping
+        self._wake_fd: int | None = None
+        self._wake_lock = Lock()
 
     def __enter__(self):
         """Start the MockoonServer and return the instance when used in a 'with' statement."""
@@ -122,7 +201,7 @@ class MockoonServer:
         """Stop the MockoonServer when exiting a 'with' statement."""
         self.stop()
 
-    @property
+    @cached_property
     def _mockoon_cli_command(self):
         """Construct the mockoon-cli command based on the instance properties.
 
@@ -140,7 +219,7 @@ class MockoonServer:
                 f"type=bind,source={self.data_file.resolve()},target=/data,readonly",
                 "-p",
                 f"{self.port}:{self.port}",
-                "mockoon/cli:latest",
+                self.DOCKER_IMAGE,
                 "--log-transaction",
                 "--data",
                 "data",
@@ -160,80 +239,170 @@ class MockoonServer:
 
         command += ["--pname", self.pname, "--port", str(self.port)]
 
-        command += [
-            "--pname",
-            self.pname,
-            "--hostname",
-            self.hostname,
-            "--port",
-            str(self.port),
-        ]
-
         if self.repair:
             command += ["--repair"]
 
         return command
 
-    def _stream_logs(self, log_source):
-        """Stream the JSON-formatted stdout output of the mockoon-cli process and process the log lines."""
-        if not log_source:
-            return
-
-        def process_line(line):
-            """Process a log line by parsing the JSON-formatted output, updating the log messages, and emitting events for server readiness and transactions on specific routes."""
-            log_entry = json.loads(line)
+    def _process_log_lines(self, lines):
+        """Process a batch of log lines by parsing the JSON-formatted output, updating the log messages, and emitting events for server readiness and transactions on specific routes."""
+        # Only lines with a transaction or the server start message are used, so skip parsing any others
+        #   unless all messages are to be kept
+        log_messages = [
+            _parse_log_line(line)
+            for line in lines
+            if self.keep_all_messages
+            or _TRANSACTION_KEY in line
+            or (not self._ready_seen and _SERVER_STARTED_PREFIX_BYTES in line)
+        ]
 
-            log_message = LogMessage.from_log_entry(log_entry)
+        self.log_messages.extend(log_messages)
 
+        events = []
+        transactions_received = False
+        for log_message in log_messages:
             if transaction := log_message.transaction:
                 logger.info(f"Transaction received: {transaction}")
 
+                self._transactions.append(transaction)
+                self._requests.append(transaction.request)
+                self._method_and_route_counts[
+                    transaction.request.method,
+                    transaction.request.route,
+                ] += 1
+                transactions_received = True
+
                 # Add 'received request' event for each route
                 #   so that tests can wait for logs to be written
-                route = transaction.request.route
-                self.event_queue.put(route)
+                events.append(sys.intern(transaction.request.route))
             else:
                 logger.debug(f"Message from server has no transaction: {log_message}")
 
-            self.log_messages.append(log_message)
+            # The server only reports that it has started once
+            if not self._ready_seen and log_message.message.startswith(
+                _SERVER_STARTED_PREFIX,
+            ):
+                self._ready_seen = True
+                events.append(_READY_EVENT)
+
+        if transactions_received:
+            # Bump the version so that cached views of the transactions
+            #   are rebuilt on next access
+            self.transactions_version += 1
+
+        if events:
+            self._emit_events(events)
+
+    def _run_log_stream(self, log_source):
+        """Stream the logs, waking up any threads waiting for events once the stream has ended."""
+        try:
+            self._stream_logs(log_source)
+        finally:
+            with self._events_condition:
+                self._log_stream_ended = True
+                self._events_condition.notify_all()
+
+    def _start_log_streaming_thread(self, log_source):
+        """Start a thread to stream the logs from the log source."""
+        with self._events_condition:
+            self._log_stream_ended = False
+        self.log_streaming_thread = Thread(
+            target=self._run_log_stream,
+            args=[log_source],
+        )
+        self.log_streaming_thread.start()
 
-            server_start_msg_prefix = "Server started on port "
-            message = log_message.message
-            if server_start_msg_prefix in message:
-                self.event_queue.put("ready")
+    def _stream_logs(self, log_source):
+        """Stream the JSON-formatted stdout output of the mockoon-cli process and process the log lines."""
+        if not log_source:
+            return
 
         if self.use_docker:
-            for line in log_source.stdout:
-                if self.stop_event.is_set():
-                    break
-                process_line(line)
+            self._stream_pipe(log_source.stdout)
         else:
-            event_handler = LogFileEventHandler(
-                callback=process_line,
-                target_file=log_source,
-            )
+            # The handler is kept between streams, so that a restarted stream resumes from its offset
+            if self._log_file_handler is None:
+                self._log_file_handler = LogFileEventHandler(
+                    callback=self._process_log_lines,
+                    target_file=log_source,
+                )
+            event_handler = self._log_file_handler
             event_handler.initial_read()
-            observer = PollingObserver()
-            observer.schedule(event_handler, path=log_source.parent, recursive=False)
-            observer.start()
+            observer = self._start_log_file_observer(event_handler, log_source.parent)
 
-            while not self.stop_event.is_set():
-                sleep(0.1)
+            # Block until the server is stopped - the observer thread handles file events
+            self.stop_event.wait()
 
             observer.stop()
             observer.join()
 
+    def _start_log_file_observer(self, event_handler, path):
+        """Start an observer for the log file directory.
+
+        Native file system events are used unless polling is requested (e.g. for log directories on network mounts)
+        or native events are not available for the directory.
+        """
+        if not os.environ.get("MOCKOON_USE_POLLING_OBSERVER"):
+            observer = Observer()
+            try:
+                observer.schedule(event_handler, path=path, recursive=False)
+                observer.start()
+            except OSError as e:
+                logger.info(f"Falling back to polling for log file events: {e}")
+            else:
+                return observer
+
+        observer = PollingObserver(timeout=self.poll_interval)
+        observer.schedule(event_handler, path=path, recursive=False)
+        observer.start()
+        return observer
+
+    def _stream_pipe(self, pipe):
+        """Read the pipe in chunks and process each batch of complete lines, until the pipe is closed or the server is stopped."""
+        wake_read_fd, wake_write_fd = os.pipe()
+        with self._wake_lock:
+            self._wake_fd = wake_write_fd
+
+        # Uses epoll where available, so the fds are registered once rather than on every wait
+        selector = DefaultSelector()
+        try:
+            pipe_fd = pipe.fileno()
+            selector.register(pipe_fd, EVENT_READ)
+            selector.register(wake_read_fd, EVENT_READ)
+            while not self.stop_event.is_set():
+                ready = selector.select()
+                if any(key.fd == wake_read_fd for key, _ in ready):
+                    break
+
+                chunk = os.read(pipe_fd, self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                # Keep any partial line at the end of the chunk for the next read,
+                #   which may be made by a later stream from the same log source
+                *lines, self._pipe_buffer = (self._pipe_buffer + chunk).split(b"\n")
+                if lines := [line for line in lines if line.strip()]:
+                    self._process_log_lines(lines)
+        finally:
+            selector.close()
+            with self._wake_lock:
+                self._wake_fd = None
+            os.close(wake_read_fd)
+            os.close(wake_write_fd)
+
+    def _set_stop_event(self):
+        """Signal the log streaming thread to stop, waking it if it is blocked reading the Docker logs."""
+        self.stop_event.set()
+        with self._wake_lock:
+            if self._wake_fd is not None:
+                os.write(self._wake_fd, b"\0")
+
     def _cleanup(self):
         """Clean up any running mockoon-cli or Docker processes related to the mock server."""
-        if which("docker"):
-            run(
-                ["docker", "stop", "mockoon-cli", "-t", "0"],
-                stdout=DEVNULL,
-                stderr=DEVNULL,
-            )
-            run(["docker", "rm", "mockoon-cli"], stdout=DEVNULL, stderr=DEVNULL)
+        if _has_command("docker"):
+            run(["docker", "rm", "-f", "mockoon-cli"], stdout=DEVNULL, stderr=DEVNULL)
 
-        if which("mockoon-cli"):
+        if _has_command("mockoon-cli"):
             run(
                 ["mockoon-cli", "stop", f"mockoon-{self.pname}"],
                 stdout=DEVNULL,
@@ -241,40 +410,44 @@ class MockoonServer:
             )
 
     def _pre_start(self):
-        """Perform pre-start operations such as pulling the latest Docker image for Mockoon (if using Docker) or deleting any existing log files."""
+        """Perform pre-start operations such as pulling the Docker image for Mockoon (if using Docker and not already pulled) or deleting any existing log files."""
         if self.use_docker:
-            run(
-                ["docker", "pull", "mockoon/cli:latest"],
+            image_inspect = run(
+                ["docker", "image", "inspect", self.DOCKER_IMAGE],
                 stdout=DEVNULL,
                 stderr=DEVNULL,
+                check=False,
             )
+            if image_inspect.returncode != 0:
+                run(
+                    ["docker", "pull", self.DOCKER_IMAGE],
+                    stdout=DEVNULL,
+                    stderr=DEVNULL,
+                )
 
         else:
-            Path(
-                f"~/.mockoon-cli/logs/mockoon-{self.pname}-out.log",
-            ).expanduser().unlink(missing_ok=True)
+            self._log_path.unlink(missing_ok=True)
 
     def start_log_stream(self):
         if not self.log_streaming_thread or not self.log_streaming_thread.is_alive():
-            self.log_streaming_thread = Thread(
-                target=self._stream_logs,
-                args=[self._log_source()],
-            )
-            self.log_streaming_thread.start()
+            self.stop_event.clear()
+            self._start_log_streaming_thread(self._log_source())
 
     def stop_log_stream(self):
         if self.log_streaming_thread and self.log_streaming_thread.is_alive():
-            self.stop_event.set()
+            self._set_stop_event()
             self.log_streaming_thread.join()
 
     def _log_source(self):
+        if self._log_source_handle is not None:
+            return self._log_source_handle
+
         if self.use_docker:
             src = Popen(["docker", "logs", "-f", "mockoon-cli"], stdout=PIPE)
         else:
-            src = Path(
-                f"~/.mockoon-cli/logs/mockoon-{self.pname}-out.log",
-            ).expanduser()
+            src = self._log_path
 
+        self._log_source_handle = src
         return src
 
     def start(self):
@@ -284,94 +457,97 @@ class MockoonServer:
         to the `logs` property of the `MockoonServer` instance.
         """
         self.stop()
+        self.stop_event.clear()
 
-        self._pre_start()
+        with self._events_condition:
+            self._pending_events.clear()
+        self._ready_seen = False
 
-        run(self._mockoon_cli_command, stdout=DEVNULL, stderr=DEVNULL)
+        self._pre_start()
 
         if self.use_docker:
-            log_source = Popen(["docker", "logs", "-f", "mockoon-cli"], stdout=PIPE)
+            # The container must exist before its logs can be followed
+            run(self._mockoon_cli_command, stdout=DEVNULL, stderr=DEVNULL)
         else:
-            target_file = Path(
-                f"~/.mockoon-cli/logs/mockoon-{self.pname}-out.log",
-            ).expanduser()
-
-            if not target_file.is_file():
-                observer = Observer()
-                event_handler = WaitForFileCreationHandler(observer, target_file)
-
-                observer.schedule(
-                    event_handler,
-                    path=target_file.parent,
-                    recursive=False,
-                )
-                observer.start()
-
-                timeout = 60  # Timeout in seconds
-                start_time = time()
-
-                try:
-                    while observer.is_alive() and time() - start_time < timeout:
-                        observer.join(timeout=1)
-                except Exception as e:
-                    logger.info(f"Error: {e}")
-                finally:
-                    observer.stop()
-                observer.join()
+            # Wait for the log file while mockoon-cli starts up
+            self._cli_process = Popen(
+                self._mockoon_cli_command,
+                stdout=DEVNULL,
+                stderr=DEVNULL,
+            )
 
-                if time() - start_time >= timeout:
+        log_source = self._log_source()
+        if not self.use_docker:
+            # mockoon-cli creates the log file shortly after starting
+            deadline = monotonic() + self.LOG_FILE_TIMEOUT
+            while not log_source.is_file():
+                if monotonic() >= deadline:
                     msg = "Timeout reached. Server log file not created"
                     raise Exception(msg)
+                sleep(self.LOG_FILE_POLL_INTERVAL)
 
-            log_source = target_file
-
-        self.log_streaming_thread = Thread(
-            target=self._stream_logs,
-            args=[log_source],
-        )
-        self.log_streaming_thread.start()
+        self._start_log_streaming_thread(log_source)
 
         # Wait for server to start
         self.wait_for_active()
 
+    def _emit_events(self, events):
+        """Record events from the log stream and wake up any threads waiting for events."""
+        with self._events_condition:
+            self._pending_events.update(events)
+            self._events_condition.notify_all()
+
     def _wait_for_event(self, expected_event, timeout=None):
-        wait_timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        """Wait for an event from the log stream, consuming it once received.
 
-        start_time = time()
-        timeout_time = start_time + wait_timeout
+        Events that are received while waiting for a different event are kept for later waits.
+        """
+        wait_timeout = self.WAIT_TIMEOUT if timeout is None else timeout
 
-        while True:
+        with self._events_condition:
             if (
                 not self.log_streaming_thread
                 or not self.log_streaming_thread.is_alive()
-            ):
+            ) and not self._pending_events[expected_event]:
                 msg = "Server thread is not alive."
                 raise Exception(msg)
 
-            if time() > timeout_time:
-                msg = f"Server did not start within {wait_timeout} seconds."
-                raise Exception(msg)
+            # Waiting stops early if the log stream ends, as the event can no longer arrive
+            self._events_condition.wait_for(
+                lambda: self._pending_events[expected_event] > 0
+                or self._log_stream_ended,
+                timeout=wait_timeout,
+            )
+            if not self._pending_events[expected_event]:
+                if self._log_stream_ended or not self.log_streaming_thread.is_alive():
+                    msg = "Server thread is not alive."
+                    raise Exception(msg)
 
-            event = None
-            try:
-                remaining_timeout_time = timeout_time - time()
-                event = self.event_queue.get(timeout=remaining_timeout_time)
-            except Empty:
-                pass
+                msg = f"Timed out after {wait_timeout} seconds waiting for event: {expected_event}"
+                raise Exception(msg)
 
-            if event == expected_event:
-                return
+            self._pending_events[expected_event] -= 1
 
-    def wait_for_active(self):
+    def wait_for_active(self, timeout: float | None = None):
         """Waits for the mock server to be active.
 
         This method waits for the `mockoon-cli` process started in `start`, if available.
+
+        Parameters
+        ----------
+        timeout (float, optional): Seconds to wait before giving up. Defaults to WAIT_TIMEOUT.
         """
-        self._wait_for_event("ready")
+        self._wait_for_event(_READY_EVENT, timeout)
 
-    def wait_for_route_hit(self, route: str):
-        """Wait for the mock server to be have written logs about a transaction on a particular route."""
-        self._wait_for_event(f"/{route}")
+    def wait_for_route_hit(self, route: str, timeout: float | None = None):
+        """Wait for the mock server to be have written logs about a transaction on a particular route.
+
+        Parameters
+        ----------
+        route (str): The route to wait for, without the leading slash.
+        timeout (float, optional): Seconds to wait before giving up. Defaults to WAIT_TIMEOUT.
+        """
+        self._wait_for_event(sys.intern(f"/{route}"), timeout)
 
     def stop(self):
         """Stop the mock API.
@@ -380,21 +556,59 @@ class MockoonServer:
         """
         self._cleanup()
 
+        if self._cli_process is not None:
+            # mockoon-cli may stay in the foreground rather than exit once the server has started
+            try:
+                self._cli_process.wait(timeout=self.PROCESS_STOP_TIMEOUT)
+            except TimeoutExpired:
+                _stop_process(self._cli_process, self.PROCESS_STOP_TIMEOUT)
+            self._cli_process = None
+
+        if isinstance(self._log_source_handle, Popen):
+            _stop_process(self._log_source_handle, self.PROCESS_STOP_TIMEOUT)
+
         if self.log_streaming_thread:
-            self.stop_event.set()
+            self._set_stop_event()
             self.log_streaming_thread.join()
 
+        # The streaming thread has finished reading from the pipe, so it can be closed
+        if isinstance(self._log_source_handle, Popen):
+            self._log_source_handle.stdout.close()
+
+        if self._log_file_handler is not None:
+            self._log_file_handler.close()
+
+        self._log_source_handle = None
+        self._pipe_buffer = b""
+        self._log_file_handler = None
+
     @property
     def root_uri(self):
         return f"http://localhost:{self.port}"
 
     @property
     def transactions(self):
-        """Return transactions from log messages that contained them."""
-        return [
-            log.transaction for log in self.log_messages if log.transaction is not None
-        ]
+        """Return the transactions from the log messages, kept up to date as transactions are received."""
+        return self._transactions
+
+    @property
+    def request_list(self):
+        """Return the requests from the transactions, kept up to date as transactions are received."""
+        return self._requests
+
+    @property
+    def method_and_route_counts(self):
+        """Return the number of requests received for each (method, route) pair."""
+        return self._method_and_route_counts
 
     def reset_transactions(self):
         """Reset the transactions list."""
-        self.log_messages = []
+        self.log_messages.clear()
+        self._transactions = []
+        self._requests = []
+        self._method_and_route_counts = Counter()
+        self.transactions_version += 1
+
+        # Route hits from before the reset should not satisfy later waits
+        with self._events_condition:
+            self._pending_events.clear()
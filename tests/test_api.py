@@ -0,0 +1,48 @@
+import pathlib
+
+import pytest
+
+from mockoon import MockoonAPI, MockoonTransactionAssertion
+from tests.test_assertion import FakeServer, make_request
+
+DATA_FILE = f"{pathlib.Path(__file__).parent.resolve()}/data/demo.json"
+
+
+@pytest.fixture()
+def server():
+    return FakeServer()
+
+
+@pytest.fixture()
+def api(monkeypatch, server):
+    # Allow an API to be created without mockoon-cli being installed
+    monkeypatch.setattr("mockoon.server._has_command", lambda _command: True)
+    api = MockoonAPI(data_file=DATA_FILE)
+    api.assertions = MockoonTransactionAssertion(server)
+    return api
+
+
+def test_assert_methods_are_forwarded_to_assertions(api, server):
+    server.add(make_request())
+
+    api.assert_called_once()
+    api.assert_called_once_with(make_request())
+    api.assert_called_with_properties(method="GET", route="/hello")
+
+    with pytest.raises(AssertionError):
+        api.assert_not_called()
+
+
+def test_forwarded_assert_methods_are_cached(api):
+    assert_called = api.assert_called
+
+    assert api.__dict__["assert_called"] == assert_called
+    assert api.assert_called is assert_called
+
+
+def test_other_missing_attributes_are_not_forwarded(api):
+    with pytest.raises(AttributeError, match="'MockoonAPI' object has no attribute"):
+        _ = api.call_count
+
+    with pytest.raises(AttributeError):
+        _ = api.assert_unknown
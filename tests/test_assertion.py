@@ -0,0 +1,195 @@
+from collections import Counter
+
+import pytest
+
+from mockoon import MockoonTransactionAssertion, Request, Response, Transaction
+from mockoon.assertion import TransactionAssertion
+
+
+class FakeServer:
+    """Minimal stand-in for MockoonServer that only tracks transactions."""
+
+    def __init__(self):
+        self.transactions: list[Transaction] = []
+        self.request_list: list[Request] = []
+        self.method_and_route_counts: Counter[tuple[str, str]] = Counter()
+        self.transactions_version = 0
+
+    def add(self, request: Request):
+        self.transactions.append(
+            Transaction(
+                proxied=False,
+                request=request,
+                response=Response(body="", headers={}, statusCode=200),
+                routeResponseUUID=None,
+                routeUUID=None,
+            ),
+        )
+        self.request_list.append(request)
+        self.method_and_route_counts[request.method, request.route] += 1
+        self.transactions_version += 1
+
+    def reset_transactions(self):
+        self.transactions = []
+        self.request_list = []
+        self.method_and_route_counts = Counter()
+        self.transactions_version += 1
+
+
+def make_request(route="/hello", method="GET", **kwargs):
+    fields = {
+        "body": "",
+        "headers": {"accept": "*/*"},
+        "method": method,
+        "params": {},
+        "query": "",
+        "queryParams": {},
+        "route": route,
+        "urlPath": route,
+    }
+    fields.update(kwargs)
+    return Request(**fields)
+
+
+@pytest.fixture()
+def server():
+    return FakeServer()
+
+
+@pytest.fixture()
+def assertions(server):
+    return MockoonTransactionAssertion(server)
+
+
+def test_call_requests_list_follows_server_transactions(server, assertions):
+    server.add(make_request())
+
+    assert assertions.call_requests_list is server.request_list
+    assert assertions.call_count == 1
+    assertions.assert_called_once_with(make_request())
+
+    server.add(make_request("/world"))
+
+    assert assertions.call_requests_list == [make_request(), make_request("/world")]
+    assertions.assert_called_once_with(make_request("/world"))
+    assert assertions.call_request == make_request("/world")
+
+    server.reset_transactions()
+
+    assertions.assert_not_called()
+    assert assertions.call_request is None
+
+
+def test_assert_called_with_request(server, assertions):
+    server.add(make_request())
+    server.add(make_request("/world"))
+    server.add(make_request("/world"))
+
+    assertions.assert_called_once_with(make_request())
+    assertions.assert_called_with(make_request("/world"))
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_once_with(make_request("/world"))
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_with(make_request(headers={}))
+
+
+def test_assert_called_with_properties(server, assertions):
+    server.add(make_request())
+    server.add(make_request("/world", method="POST"))
+
+    assertions.assert_called_once_with_properties(method="GET", route="/hello")
+    assertions.assert_called_with_properties(method="POST", route="/world")
+    assertions.assert_called_with_properties(method="POST")
+    assertions.assert_has_calls_with_properties(
+        [{"route": "/world"}, {"method": "GET"}],
+        any_order=True,
+    )
+    assertions.assert_has_calls_with_properties(
+        [{"method": "GET"}, {"route": "/world"}],
+    )
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_with_properties(method="PUT")
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_with_properties(method="GET", route="/world")
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_once_with_properties(headers={"accept": "*/*"})
+
+    with pytest.raises(AssertionError):
+        assertions.assert_has_calls_with_properties(
+            [{"route": "/world"}, {"method": "GET"}],
+        )
+
+    server.add(make_request())
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_once_with_properties(method="GET", route="/hello")
+
+
+def test_assert_called_with_unhashable_method_and_route(server, assertions):
+    server.add(make_request())
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_with_properties(method="GET", route=["/hello"])
+
+    with pytest.raises(AssertionError):
+        assertions.assert_called_once_with_properties(method={"GET"}, route="/hello")
+
+
+def test_assert_has_calls(server, assertions):
+    server.add(make_request())
+    server.add(make_request("/world"))
+    server.add(make_request())
+
+    assertions.assert_has_calls([make_request(), make_request()])
+    assertions.assert_has_calls([make_request("/world"), make_request()])
+    assertions.assert_has_calls([])
+    assertions.assert_has_calls(
+        [make_request(), make_request("/world"), make_request()],
+        any_order=True,
+    )
+
+    with pytest.raises(AssertionError):
+        assertions.assert_has_calls([make_request("/world"), make_request("/world")])
+
+    with pytest.raises(AssertionError, match="/world"):
+        assertions.assert_has_calls(
+            [make_request("/world"), make_request("/world")],
+            any_order=True,
+        )
+
+
+def test_assert_called_with_unknown_property(server, assertions):
+    server.add(make_request())
+
+    with pytest.raises(TypeError, match="status"):
+        assertions.assert_called_with_properties(route="/hello", status=200)
+
+
+def test_assert_has_calls_with_properties_counts_repeated_calls(server, assertions):
+    server.add(make_request())
+    server.add(make_request("/world"))
+    server.add(make_request())
+
+    assertions.assert_has_calls_with_properties(
+        [{"route": "/hello"}, {"method": "GET"}, {"route": "/hello"}],
+        any_order=True,
+    )
+    assertions.assert_has_calls_with_properties([])
+
+    with pytest.raises(AssertionError):
+        assertions.assert_has_calls_with_properties(
+            [{"route": "/world"}, {"route": "/world"}],
+            any_order=True,
+        )
+
+
+def test_assertions_define_every_protocol_member():
+    # Protocol members are stubs, so each must be defined rather than inherited
+    members = {name for name in vars(TransactionAssertion) if not name.startswith("_")}
+
+    assert members <= set(vars(MockoonTransactionAssertion))
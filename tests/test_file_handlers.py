@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+from mockoon.file_handlers import LogFileEventHandler
+
+
+def modified_event(path):
+    return SimpleNamespace(src_path=str(path), is_directory=False)
+
+
+def test_log_file_handler_only_reads_new_complete_lines(tmp_path):
+    log_file = tmp_path / "mockoon-test-out.log"
+    log_file.write_text("line 1\nline 2\n")
+
+    lines = []
+    handler = LogFileEventHandler(callback=lines.extend, target_file=log_file)
+    handler.initial_read()
+
+    assert lines == [b"line 1\n", b"line 2\n"]
+
+    with log_file.open("a") as file:
+        file.write("line 3\nline 4\nline")
+    handler.on_modified(modified_event(log_file))
+
+    assert lines == [b"line 1\n", b"line 2\n", b"line 3\n", b"line 4\n"]
+
+    with log_file.open("a") as file:
+        file.write(" 5\n")
+    handler.on_modified(modified_event(log_file))
+
+    assert lines[-1] == b"line 5\n"
+
+    handler.close()
+
+
+def test_log_file_handler_restarts_after_truncation(tmp_path):
+    log_file = tmp_path / "mockoon-test-out.log"
+    log_file.write_text("line 1\nline 2\n")
+
+    lines = []
+    handler = LogFileEventHandler(callback=lines.extend, target_file=log_file)
+    handler.initial_read()
+
+    log_file.write_text("new\n")
+    handler.on_modified(modified_event(log_file))
+
+    assert lines == [b"line 1\n", b"line 2\n", b"new\n"]
+
+    handler.close()
+
+
+def test_log_file_handler_ignores_other_files(tmp_path):
+    log_file = tmp_path / "mockoon-test-out.log"
+    log_file.write_text("")
+    other_file = tmp_path / "mockoon-other-out.log"
+    other_file.write_text("line 1\n")
+
+    lines = []
+    handler = LogFileEventHandler(callback=lines.extend, target_file=log_file)
+    handler.initial_read()
+
+    log_file.write_text("line 1\n")
+    handler.on_modified(modified_event(other_file))
+    handler.on_modified(SimpleNamespace(src_path=str(log_file), is_directory=True))
+
+    assert lines == []
+
+    handler.close()
@@ -1,10 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
+import pytest
 from polyfactory import Use
 from polyfactory.factories.pydantic_factory import ModelFactory
 from polyfactory.pytest_plugin import register_fixture
+from pydantic import ValidationError
 
-from mockoon.models import LogMessage, Transaction
+from mockoon.models import LogMessage, Request, Transaction
 
 possible_messages = ["Message 1", "Message 2", "Message 3"]
 
@@ -13,7 +15,11 @@ class LogMessageFactory(ModelFactory[LogMessage]):
 
     level = "info"
     message = Use(ModelFactory.__random__.choice, possible_messages)
-    timestamp = lambda: datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+    @staticmethod
+    def timestamp():
+        now = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        return now.replace("+00:00", "Z")
 
 
 log_message_factory_fixture = register_fixture(LogMessageFactory)
@@ -32,3 +38,49 @@ def test_log_message_factory(log_message_factory: LogMessageFactory) -> None:
     assert isinstance(log_message_instance.timestamp, str)
     assert isinstance(log_message_instance.mockName, str | None)
     assert isinstance(log_message_instance.transaction, Transaction | None)
+
+
+def test_request_from_log_entry() -> None:
+    log_entry = {
+        "body": "",
+        "headers": [{"key": "accept", "value": "*/*"}, {"key": "host"}],
+        "method": "GET",
+        "params": [],
+        "query": "name=test",
+        "queryParams": [{"key": "name", "value": "test"}],
+        "route": "/hello",
+        "urlPath": "/hello",
+    }
+    request = Request.from_log_entry(log_entry)
+
+    # The log entry is not modified while parsing
+    assert "headers" in log_entry
+
+    assert request.headers == {"accept": "*/*"}
+    assert request.params == {}
+    assert request.queryParams == {"name": "test"}
+    assert request.route == "/hello"
+
+    with pytest.raises(ValidationError):
+        request.route = "/world"
+
+
+def test_request_is_hashable() -> None:
+    request = Request(
+        body="",
+        headers={"accept": "*/*", "host": "localhost:3000"},
+        method="GET",
+        params={},
+        query="",
+        queryParams={},
+        route="/hello",
+        urlPath="/hello",
+    )
+    same_request = request.model_copy(
+        update={"headers": {"host": "localhost:3000", "accept": "*/*"}},
+    )
+    other_request = request.model_copy(update={"route": "/world"})
+
+    assert request == same_request
+    assert request != other_request
+    assert {request, same_request, other_request} == {request, other_request}
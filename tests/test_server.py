@@ -0,0 +1,363 @@
+import json
+import os
+import pathlib
+from subprocess import PIPE, CompletedProcess, Popen
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+
+from mockoon import MockoonServer
+
+DATA_FILE = f"{pathlib.Path(__file__).parent.resolve()}/data/demo.json"
+
+
+@pytest.fixture()
+def make_server(monkeypatch):
+    # Allow servers to be created without mockoon-cli being installed
+    monkeypatch.setattr("mockoon.server._has_command", lambda _command: True)
+
+    def make_server(data_file=DATA_FILE, **kwargs):
+        return MockoonServer(data_file=data_file, **kwargs)
+
+    return make_server
+
+
+@pytest.fixture()
+def server(make_server):
+    return make_server()
+
+
+@pytest.fixture()
+def log_streaming_thread(server):
+    stop_event = Event()
+    server.log_streaming_thread = Thread(target=stop_event.wait)
+    server.log_streaming_thread.start()
+    yield server.log_streaming_thread
+    stop_event.set()
+    server.log_streaming_thread.join()
+
+
+@pytest.mark.usefixtures("log_streaming_thread")
+def test_wait_for_route_hit_keeps_other_events(server):
+    emit_events = server._emit_events  # noqa: SLF001
+    emit_events(["/world", "/hello"])
+    emit_events(["/hello"])
+
+    server.wait_for_route_hit("hello", timeout=0)
+    server.wait_for_route_hit("world", timeout=0)
+    server.wait_for_route_hit("hello", timeout=0)
+
+    with pytest.raises(Exception, match="Timed out"):
+        server.wait_for_route_hit("hello", timeout=0)
+
+
+@pytest.mark.usefixtures("log_streaming_thread")
+def test_wait_for_route_hit_wakes_on_event(server):
+    emit_events = server._emit_events  # noqa: SLF001
+    Thread(target=emit_events, args=[["/hello"]]).start()
+
+    server.wait_for_route_hit("hello", timeout=5)
+
+
+@pytest.mark.usefixtures("log_streaming_thread")
+def test_reset_transactions_discards_pending_events(server):
+    server._emit_events(["/hello"])  # noqa: SLF001
+
+    server.reset_transactions()
+
+    with pytest.raises(Exception, match="Timed out"):
+        server.wait_for_route_hit("hello", timeout=0)
+
+
+def test_wait_for_route_hit_fails_when_log_stream_ends(monkeypatch, server):
+    stream_ended = Event()
+    monkeypatch.setattr(server, "_stream_logs", lambda _log_source: stream_ended.wait())
+    server._start_log_streaming_thread(None)  # noqa: SLF001
+    Thread(target=stream_ended.set).start()
+
+    with pytest.raises(Exception, match="not alive"):
+        server.wait_for_route_hit("hello", timeout=30)
+
+    server.log_streaming_thread.join()
+
+
+def log_line(message, route=None):
+    log_entry = {
+        "level": "info",
+        "message": message,
+        "timestamp": "2023-05-01T12:00:00.000Z",
+    }
+    if route:
+        log_entry["mockName"] = "mockoon-demo"
+        log_entry["transaction"] = {
+            "proxied": False,
+            "request": {
+                "body": "",
+                "headers": [],
+                "method": "GET",
+                "params": [],
+                "query": "",
+                "queryParams": [],
+                "route": route,
+                "urlPath": route,
+            },
+            "response": {"body": "", "headers": [], "statusCode": 200},
+        }
+    return (json.dumps(log_entry) + "\n").encode()
+
+
+@pytest.mark.usefixtures("log_streaming_thread")
+def test_process_log_lines(server):
+    server._process_log_lines(  # noqa: SLF001
+        [
+            log_line("Server started on port 3000"),
+            log_line("Some other message"),
+            log_line("Transaction recorded", route="/hello"),
+            log_line("Transaction recorded", route="/world"),
+        ],
+    )
+
+    assert [log.message for log in server.log_messages] == [
+        "Server started on port 3000",
+        "Transaction recorded",
+        "Transaction recorded",
+    ]
+    assert [request.route for request in server.request_list] == ["/hello", "/world"]
+    assert [t.request.route for t in server.transactions] == ["/hello", "/world"]
+    assert server.method_and_route_counts == {
+        ("GET", "/hello"): 1,
+        ("GET", "/world"): 1,
+    }
+
+    server.wait_for_active(timeout=0)
+    server.wait_for_route_hit("world", timeout=0)
+
+    # Only the first start message marks the server as ready
+    server._process_log_lines([log_line("Server started on port 3000")])  # noqa: SLF001
+    with pytest.raises(Exception, match="Timed out"):
+        server.wait_for_active(timeout=0)
+    server.wait_for_route_hit("hello", timeout=0)
+
+    version = server.transactions_version
+    server.reset_transactions()
+
+    assert server.transactions_version != version
+    assert server.request_list == []
+    assert server.transactions == []
+    assert not server.method_and_route_counts
+
+
+def test_log_messages_are_bounded(monkeypatch, make_server):
+    monkeypatch.setattr(MockoonServer, "MAX_LOG_MESSAGES", 2)
+    server = make_server()
+
+    server._process_log_lines(  # noqa: SLF001
+        [log_line(f"Message {i}", route="/hello") for i in range(3)],
+    )
+
+    assert [log.message for log in server.log_messages] == ["Message 1", "Message 2"]
+
+
+def test_keep_all_log_messages(make_server):
+    server = make_server(keep_all_messages=True)
+
+    server._process_log_lines(  # noqa: SLF001
+        [
+            log_line("Some other message"),
+            log_line("Transaction recorded", route="/hello"),
+        ],
+    )
+
+    assert [log.message for log in server.log_messages] == [
+        "Some other message",
+        "Transaction recorded",
+    ]
+    assert [request.route for request in server.request_list] == ["/hello"]
+
+
+def test_stream_pipe_processes_lines_until_stopped(server):
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as pipe:
+        server.log_streaming_thread = Thread(
+            target=server._stream_pipe,  # noqa: SLF001
+            args=[pipe],
+        )
+        server.log_streaming_thread.start()
+
+        data = log_line("Transaction recorded", route="/hello") * 2
+        os.write(write_fd, data[:20])
+        os.write(write_fd, data[20:])
+
+        server.wait_for_route_hit("hello", timeout=5)
+        server.wait_for_route_hit("hello", timeout=5)
+
+        # The stream is idle, so only the stop signal can end it
+        server.stop_log_stream()
+
+        assert not server.log_streaming_thread.is_alive()
+
+    os.close(write_fd)
+
+
+def test_stop_terminates_docker_log_source(monkeypatch, server):
+    monkeypatch.setattr(server, "_cleanup", lambda: None)
+    server.use_docker = True
+    # Stands in for 'docker logs -f', which never exits on its own
+    log_source = Popen(["cat"], stdin=PIPE, stdout=PIPE)
+    server._log_source_handle = log_source  # noqa: SLF001
+
+    assert server._log_source() is log_source  # noqa: SLF001
+
+    server.start_log_stream()
+    server.stop()
+
+    assert log_source.returncode is not None
+    assert not server.log_streaming_thread.is_alive()
+    assert server._log_source_handle is None  # noqa: SLF001
+    assert log_source.stdout.closed
+    log_source.stdin.close()
+
+
+def test_stop_terminates_foreground_cli_process(monkeypatch, server):
+    monkeypatch.setattr(server, "_cleanup", lambda: None)
+    monkeypatch.setattr(server, "PROCESS_STOP_TIMEOUT", 0.1)
+    # Stands in for a 'mockoon-cli start' that stays in the foreground
+    cli_process = Popen(["sleep", "60"])
+    server._cli_process = cli_process  # noqa: SLF001
+
+    server.stop()
+
+    assert cli_process.returncode is not None
+    assert server._cli_process is None  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    ("image_inspect_returncode", "pulled"),
+    [(0, False), (1, True)],
+)
+def test_pre_start_only_pulls_missing_docker_image(
+    monkeypatch,
+    server,
+    image_inspect_returncode,
+    pulled,
+):
+    commands = []
+
+    def run(command, **_kwargs):
+        commands.append(command)
+        return CompletedProcess(command, image_inspect_returncode)
+
+    monkeypatch.setattr("mockoon.server.run", run)
+    server.use_docker = True
+
+    server._pre_start()  # noqa: SLF001
+
+    assert (["docker", "pull", server.DOCKER_IMAGE] in commands) is pulled
+
+
+def test_log_file_observer_falls_back_to_polling(monkeypatch, make_server, tmp_path):
+    class UnavailableObserver:
+        def schedule(self, *_args, **_kwargs):
+            msg = "inotify watch limit reached"
+            raise OSError(msg)
+
+    monkeypatch.setattr("mockoon.server.Observer", UnavailableObserver)
+    monkeypatch.delenv("MOCKOON_USE_POLLING_OBSERVER", raising=False)
+    server = make_server(poll_interval=0.1)
+
+    observer = server._start_log_file_observer(  # noqa: SLF001
+        FileSystemEventHandler(),
+        tmp_path,
+    )
+    try:
+        assert isinstance(observer, PollingObserver)
+        assert observer.timeout == 0.1  # noqa: PLR2004
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def test_data_file_not_parsed_when_settings_given(make_server, tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text("not JSON")
+
+    server = make_server(
+        data_file=str(data_file),
+        hostname="localhost",
+        port=3001,
+        pname="test",
+    )
+
+    assert server.root_uri == "http://localhost:3001"
+
+
+def test_stream_pipe_keeps_partial_line_across_restarts(server):
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as pipe:
+        data = log_line("Transaction recorded", route="/hello")
+
+        server.log_streaming_thread = Thread(
+            target=server._stream_pipe,  # noqa: SLF001
+            args=[pipe],
+        )
+        server.log_streaming_thread.start()
+        os.write(write_fd, data[:20])
+        # Stop once the partial line has been read from the pipe
+        for _ in range(500):
+            if server._pipe_buffer:  # noqa: SLF001
+                break
+            sleep(0.01)
+        server.stop_log_stream()
+
+        server.stop_event.clear()
+        server.log_streaming_thread = Thread(
+            target=server._stream_pipe,  # noqa: SLF001
+            args=[pipe],
+        )
+        server.log_streaming_thread.start()
+        os.write(write_fd, data[20:])
+
+        server.wait_for_route_hit("hello", timeout=5)
+        server.stop_log_stream()
+
+    os.close(write_fd)
+
+
+def test_log_file_stream_resumes_after_restart(monkeypatch, server, tmp_path):
+    monkeypatch.setattr(server, "_cleanup", lambda: None)
+    monkeypatch.delenv("MOCKOON_USE_POLLING_OBSERVER", raising=False)
+    log_file = tmp_path / "mockoon-demo-out.log"
+    log_file.write_bytes(log_line("Transaction recorded", route="/hello"))
+    server._log_path = log_file  # noqa: SLF001
+
+    try:
+        server.start_log_stream()
+        server.wait_for_route_hit("hello", timeout=5)
+        server.stop_log_stream()
+
+        server.start_log_stream()
+        with log_file.open("ab") as file:
+            file.write(log_line("Transaction recorded", route="/world"))
+        server.wait_for_route_hit("world", timeout=5)
+
+        routes = [request.route for request in server.request_list]
+        assert routes == ["/hello", "/world"]
+    finally:
+        server.stop()
+
+    assert server._log_file_handler is None  # noqa: SLF001
+
+
+@pytest.mark.parametrize("use_docker", [True, False])
+def test_mockoon_cli_command_has_each_option_once(make_server, use_docker):
+    server = make_server(use_docker=use_docker)
+
+    command = server._mockoon_cli_command  # noqa: SLF001
+    options = [arg for arg in command if str(arg).startswith("--")]
+
+    assert sorted(options) == sorted(set(options))
+    assert "--pname" in options
+    assert "--port" in options